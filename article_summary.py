@@ -1,30 +1,41 @@
-import curses
-import json
-from utils import get_url_for_topic, topic_urls, menu, getUrls, get_summary, getArticleText, knn_search
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from utils import getUrls, get_summaries, getArticleText
 from sentence_transformers import SentenceTransformer
 from mattsollamatools import chunker
 
 feed_url = "http://www.npr.org/rss/rss.php?id=1001"
 urls = getUrls(feed_url, n=1)
-model = SentenceTransformer('all-MiniLM-L6-v2')
 allEmbeddings = []
 
-for url in urls:
-    url = url.strip()
+urls = [url.strip() for url in urls]
+
+# Download the articles and ask for their summaries concurrently; each one is an independent network round trip
+with ThreadPoolExecutor(max_workers=4) as executor:
+    texts = list(executor.map(getArticleText, urls))
+summaries = get_summaries(texts)
+
+# Encode the chunks of every article in one batch instead of one encode call per article
+articleChunks = [chunker(text) for text in texts]  # Use the chunk_text function from web_utils
+allVectors = []
+# Only load the embedding model once the articles are in, and not at all for an empty feed
+if articleChunks:
+    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # Convert the whole NumPy array to lists in one call rather than row by row
+    allVectors = model.encode([chunk for chunks in articleChunks for chunk in chunks]).tolist()
+
+offset = 0
+for url, chunks, summary in zip(urls, articleChunks, summaries):
     article={}
     article['embeddings'] = []
     article['url'] = url
-    text = getArticleText(url)
-    summary = get_summary(text)
-    chunks = chunker(text)  # Use the chunk_text function from web_utils
-    embeddings = model.encode(chunks)
+    embeddings = allVectors[offset:offset + len(chunks)]
+    offset += len(chunks)
     for (chunk, embedding) in zip(chunks, embeddings):
-        item = {}
-        item['source'] = chunk
-        item['embedding'] = embedding.tolist()  # Convert NumPy array to list
-        item['sourcelength'] = len(chunk)
-        article['embeddings'].append(item)
+        article['embeddings'].append({
+            'source': chunk,
+            'embedding': embedding,
+            'sourcelength': len(chunk),
+        })
 
     allEmbeddings.append(article)
 
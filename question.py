@@ -1,4 +1,7 @@
 from langchain_community.llms import Ollama
 
 ollama = Ollama(base_url='http://192.168.68.40:11434', model="llama2")
-print(ollama.invoke("why is the sky blue"))
+# Stream the answer so text shows up while the model is still generating
+for chunk in ollama.stream("why is the sky blue"):
+    print(chunk, end="", flush=True)
+print()
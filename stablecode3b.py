@@ -1,9 +1,14 @@
 import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer
+# Run on the GPU when there is one. bfloat16 only pays off there; most CPUs have no fast bf16 matmul, so stay in float32 on CPU
+device = "cuda" if torch.cuda.is_available() else "cpu"
+dtype = torch.bfloat16 if device == "cuda" else torch.float32
+
 tokenizer = AutoTokenizer.from_pretrained("stabilityai/stable-code-instruct-3b", trust_remote_code=True)
-model = AutoModelForCausalLM.from_pretrained("stabilityai/stable-code-instruct-3b", torch_dtype=torch.bfloat16, trust_remote_code=True)
+# PyTorch's fused scaled-dot-product attention picks flash/memory-efficient kernels on the GPU when it can
+model = AutoModelForCausalLM.from_pretrained("stabilityai/stable-code-instruct-3b", torch_dtype=dtype, attn_implementation="sdpa", trust_remote_code=True)
+model.to(device)
 model.eval()
-# model = model.cuda('cpu')
 
 messages = [
     {
@@ -20,15 +25,17 @@ prompt = tokenizer.apply_chat_template(messages, add_generation_prompt=True, tok
 
 inputs = tokenizer([prompt], return_tensors="pt").to(model.device)
 
-tokens = model.generate(
-    **inputs,
-    max_new_tokens=1024,
-    temperature=0.5,
-    top_p=0.95,
-    top_k=100,
-    do_sample=True,
-    use_cache=True
-)
+# No autograd bookkeeping is needed for generation
+with torch.inference_mode():
+    tokens = model.generate(
+        **inputs,
+        max_new_tokens=1024,
+        temperature=0.5,
+        top_p=0.95,
+        top_k=100,
+        do_sample=True,
+        use_cache=True
+    )
 
 output = tokenizer.batch_decode(tokens[:, inputs.input_ids.shape[-1]:], skip_special_tokens=False)[0]
 
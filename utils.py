@@ -2,19 +2,17 @@ import os
 import curses
 import feedparser
 import requests
-import unicodedata
-import json
-from newspaper import Article
-from bs4 import BeautifulSoup
-from nltk.tokenize import sent_tokenize, word_tokenize
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from sklearn.neighbors import NearestNeighbors
-from mattsollamatools import chunker
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Create a dictionary to store topics and their URLs
 topic_urls = {
     "Mac": "https://9to5mac.com/guides/mac/feed",
@@ -25,11 +23,18 @@ topic_urls = {
 }
 
 openai_api_base = os.getenv("OPENAI_API_BASE")
+generate_url = f"{openai_api_base}api/generate"
+
+# One HTTP session for all summary requests so the connection to the server is kept alive between calls
+http_session = requests.Session()
+
+summary_model = "mistral-openorca"
+summary_system_prompt = "Write a concise summary of the text, return your responses with 5 lines that cover the key points of the text given."
 
 # Use curses to create a menu of topics
 def menu(stdscr):
     chosen_topic = get_url_for_topic(stdscr)
-    url = topic_urls[chosen_topic] if chosen_topic in topic_urls else "Topic not found"
+    url = topic_urls.get(chosen_topic, "Topic not found")
 
     stdscr.addstr(len(topic_urls) + 3, 0, f"Selected URL for {chosen_topic}: {url}")
     stdscr.refresh()
@@ -74,33 +79,54 @@ def getUrls(feed_url, n=20):
 
 # Often there are a bunch of ads and menus on pages for a news article. This uses newspaper3k to get just the text of just the article.
 def getArticleText(url):
+  # newspaper pulls in lxml, nltk and friends on import, so only load it when an article is actually fetched
+  from newspaper import Article
+
   article = Article(url)
   article.download()
   article.parse()
   return article.text
 
 def get_summary(text):
-  systemPrompt = "Write a concise summary of the text, return your responses with 5 lines that cover the key points of the text given."
   prompt = text
 
-  url = f"{openai_api_base}api/generate"
+  # Nothing to summarize (e.g. the article could not be extracted), so don't spend a model call on it
+  if not prompt or not prompt.strip():
+    return ""
 
+  return _summarize(prompt)
+
+# Identical texts get identical summaries (model and system prompt are fixed above),
+# so keep the most recent ones and skip the round trip for repeats
+@functools.lru_cache(maxsize=128)
+def _summarize(prompt):
   payload = {
-    "model": "mistral-openorca",
+    "model": summary_model,
     "prompt": prompt,
-    "system": systemPrompt,
+    "system": summary_system_prompt,
     "stream": False
   }
-  payload_json = json.dumps(payload)
-  headers = {"Content-Type": "application/json"}
-  response = requests.post(url, data=payload_json, headers=headers)
-
-#   print(response.text)
-  response_body = json.loads(response.text)["response"]
-  return response_body.strip()
+  response = http_session.post(generate_url, json=payload)
+
+  response_body = response.json()
+  logger.debug("get_summary response: %s", response_body)
+  return response_body["response"].strip()
+
+# Summarize several independent texts at once. The requests are network-bound,
+# so overlapping them in a small thread pool cuts wall time without flooding the server.
+def get_summaries(texts, max_workers=4):
+  # Identical texts would otherwise be sent in parallel before either result reaches the cache,
+  # so summarize each distinct text once and share the result
+  unique_texts = list(dict.fromkeys(texts))
+  with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    summaries = dict(zip(unique_texts, executor.map(get_summary, unique_texts)))
+  return [summaries[text] for text in texts]
 
 # Perform K-nearest neighbors (KNN) search
 def knn_search(question_embedding, embeddings, k=5):
+    # scikit-learn is slow to import and only needed here, so load it on first use
+    from sklearn.neighbors import NearestNeighbors
+
     X = np.array([item['embedding'] for article in embeddings for item in article['embeddings']])
     source_texts = [item['source'] for article in embeddings for item in article['embeddings']]
 